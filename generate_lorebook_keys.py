@@ -8,13 +8,83 @@ import json
 import re
 import sys
 import os
-from datetime import datetime
+import time
 from novelai_api import NovelAIAPI
 from novelai_api.GlobalSettings import GlobalSettings
 from novelai_api.Preset import Model, Preset
 from novelai_api.Tokenizer import Tokenizer
 from novelai_api.utils import b64_to_tokens
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Pattern used to pull keys out of a numbered list (compiled once, reused per entry)
+_NUMBERED_ITEM_RE = re.compile(r'^\s*\d+[.)]\s*(.+)')
+
+# Example entries shown to the AI before every entry that needs keys
+_EXAMPLES_BLOCK = """Examples of completed entries:
+
+----
+Quantum Plasma Rifle
+Type: item
+A prototype energy weapon that fires superheated plasma bolts capable of melting through armor plating. The rifle's power core must be recharged after every fifty shots.
+Tags: weapon, plasma, rifle, prototype, energy weapon, military, sci-fi
+
+----
+Neo-Tokyo District 7
+Type: location
+A sprawling cyberpunk metropolis where neon signs illuminate perpetual rain. Towering skyscrapers house corporate offices while street level markets sell illegal cybernetic enhancements.
+Tags: city, cyberpunk, neon, futuristic, district, tokyo, rain, corporate
+
+----
+Detective Sarah Chen
+Type: person
+A hard-boiled private investigator with cybernetic eye implants and a troubled past. She specializes in cases involving corporate espionage and missing persons in the neon-drenched streets of Neo-Tokyo.
+Tags: detective, cybernetic, investigator, private eye, chen, neo-tokyo, missing persons
+
+Now complete this entry with appropriate keys:
+"""
+
+
+def _strip_key_formatting(key):
+    """Strip whitespace, list numbering, bullet points and quotes from a key in one pass"""
+    start = 0
+    end = len(key)
+    while start < end and key[start].isspace():
+        start += 1
+    while end > start and key[end - 1].isspace():
+        end -= 1
+    
+    # Remove numbering ("1." or "1)")
+    i = start
+    while i < end and key[i].isdecimal():
+        i += 1
+    if start < i < end and key[i] in '.)':
+        start = i + 1
+        while start < end and key[start].isspace():
+            start += 1
+    
+    # Remove bullet points
+    if start < end and key[start] in '-*':
+        start += 1
+        while start < end and key[start].isspace():
+            start += 1
+    
+    # Remove quotes
+    if start < end and key[start] in '"\'':
+        start += 1
+    if end > start and key[end - 1] in '"\'':
+        end -= 1
+    
+    while start < end and key[start].isspace():
+        start += 1
+    while end > start and key[end - 1].isspace():
+        end -= 1
+    return key[start:end]
+
 
 class LorebookKeyGenerator:
     def __init__(self, min_keys=4, max_keys=10):
@@ -22,6 +92,18 @@ class LorebookKeyGenerator:
         self.max_keys = max_keys
         self.api = None
         
+        # Create preset for key generation once (focused, concise output)
+        self.preset = Preset("key_generation", Model.Kayra, {
+            "temperature": 0.3,  # Lower temperature for more consistent output
+            "max_length": 80,   # Short output to force conciseness
+            "min_length": 20,   # Ensure we get enough keys
+            "top_p": 0.8,
+            "repetition_penalty": 1.2,
+            "repetition_penalty_range": 100,
+            "top_k": 10
+        })
+        self.global_settings = GlobalSettings(num_logprobs=GlobalSettings.NO_LOGPROBS)
+        
     async def login(self):
         """Login to NovelAI API"""
         self.api = NovelAIAPI()
@@ -35,6 +117,10 @@ class LorebookKeyGenerator:
         print("Connecting to NovelAI...")
         await self.api.high_level.login_with_token(token)
         print("Login successful!")
+        
+        # Stop generating once the AI starts a new entry. A newline is not a stop
+        # sequence: responses may begin with one before the keys.
+        self.preset["stop_sequences"] = [Tokenizer.encode(Model.Kayra, "----")]
         return True
         
     def extract_entry_info(self, entry):
@@ -43,26 +129,30 @@ class LorebookKeyGenerator:
         text = entry.get('text', '')
         
         # Split by newlines and find the title and type
-        lines = text.split('\n')
         title = ""
         entry_type = ""
-        description = ""
+        description_parts = []
         
-        for line in lines:
-            if line.startswith('----'):
+        for line in text.split('\n'):
+            # Dispatch on the first character so most lines need a single compare
+            first = line[:1]
+            if first == '-' and line[:4] == '----':
                 continue
-            elif line.startswith('Type:'):
-                entry_type = line.replace('Type:', '').strip()
-            elif line.strip() and not line.startswith('Type:'):
+            elif first == 'T' and line[:5] == 'Type:':
+                entry_type = line[5:].strip()
+            else:
+                line = line.strip()
+                if not line:
+                    continue
                 if not title:
-                    title = line.strip()
+                    title = line
                 else:
-                    description += line.strip() + " "
+                    description_parts.append(line)
         
         return {
             'title': title,
             'type': entry_type,
-            'description': description.strip(),
+            'description': ' '.join(description_parts),
             'display_name': entry.get('displayName', ''),
             'current_keys': entry.get('keys', [])
         }
@@ -74,34 +164,8 @@ class LorebookKeyGenerator:
         description = entry_info['description']
         current_keys = entry_info['current_keys']
         
-        # Include original examples to show what we want
-        prompt = f"""Examples of completed entries:
-
-----
-Quantum Plasma Rifle
-Type: item
-A prototype energy weapon that fires superheated plasma bolts capable of melting through armor plating. The rifle's power core must be recharged after every fifty shots.
-Tags: weapon, plasma, rifle, prototype, energy weapon, military, sci-fi
-
-----
-Neo-Tokyo District 7
-Type: location
-A sprawling cyberpunk metropolis where neon signs illuminate perpetual rain. Towering skyscrapers house corporate offices while street level markets sell illegal cybernetic enhancements.
-Tags: city, cyberpunk, neon, futuristic, district, tokyo, rain, corporate
-
-----
-Detective Sarah Chen
-Type: person
-A hard-boiled private investigator with cybernetic eye implants and a troubled past. She specializes in cases involving corporate espionage and missing persons in the neon-drenched streets of Neo-Tokyo.
-Tags: detective, cybernetic, investigator, private eye, chen, neo-tokyo, missing persons
-
-Now complete this entry with appropriate keys:
-
-----
-{title}
-Type: {entry_type}
-{description}
-Tags:"""
+        # Original examples show what we want; only the entry itself changes per call
+        prompt = _EXAMPLES_BLOCK + f"\n----\n{title}\nType: {entry_type}\n{description}\nTags:"
         
         return prompt
         
@@ -111,19 +175,27 @@ Tags:"""
         text = raw_text.strip()
         
         # Stop at four dashes if present (AI started generating new entries)
-        if '----' in text:
-            text = text.split('----')[0].strip()
+        dashes = text.find('----')
+        if dashes >= 0:
+            text = text[:dashes].strip()
         
         # Take only the first line if there are multiple lines
         lines = text.split('\n')
         first_line = lines[0].strip() if lines else text.strip()
         
+        # Fast path for the common shape: plain comma-separated keys with no
+        # numbering, bullet points or quotes to strip
+        if '"' not in first_line and "'" not in first_line:
+            keys = [key.strip() for key in first_line.split(',')]
+            if not any(key and (key[0] in '-*' or key[0].isdecimal()) for key in keys):
+                return [key for key in keys if 0 < len(key) <= 50][:self.max_keys]
+        
         # Look for comma-separated keys on the first line
         if ',' in first_line:
             keys_text = first_line
         else:
             # Try to extract from numbered list on first line
-            numbered_match = re.search(r'(?:\d+[\.\)]\s*([^\n]+)', first_line)
+            numbered_match = _NUMBERED_ITEM_RE.match(first_line)
             if numbered_match:
                 keys_text = numbered_match.group(1)
             else:
@@ -133,13 +205,9 @@ Tags:"""
         # Clean up the keys text
         keys = []
         for key in keys_text.split(','):
-            key = key.strip()
-            # Remove any remaining formatting
-            key = re.sub(r'^\d+[\.\)]\s*', '', key)  # Remove numbering
-            key = re.sub(r'^[-*]\s*', '', key)  # Remove bullet points
-            key = re.sub(r'^["\']|["\']$', '', key)  # Remove quotes
-            key = key.strip()
-            if key and len(key) > 0:
+            # Remove any remaining formatting (numbering, bullet points, quotes)
+            key = _strip_key_formatting(key)
+            if key:
                 keys.append(key)
         
         # Filter to valid keys and limit count
@@ -152,48 +220,60 @@ Tags:"""
         
     async def generate_keys_for_entry(self, entry_info):
         """Generate keys for a single lorebook entry"""
-        prompt = self.create_generation_prompt(entry_info)
-        
-        # Create preset for key generation (focused, concise output)
-        preset = Preset("key_generation", Model.Kayra, {
-            "temperature": 0.3,  # Lower temperature for more consistent output
-            "max_length": 80,   # Short output to force conciseness
-            "min_length": 20,   # Ensure we get enough keys
-            "top_p": 0.8,
-            "repetition_penalty": 1.2,
-            "repetition_penalty_range": 100,
-            "top_k": 10
-        })
+        # Nothing to generate if the entry already has enough keys
+        if len(entry_info['current_keys']) >= self.min_keys:
+            return entry_info['current_keys']
         
-        global_settings = GlobalSettings(num_logprobs=GlobalSettings.NO_LOGPROBS)
-        
-        print(f"\n{'='*60}")
-        print(f"Entry: {entry_info['display_name']}")
-        print(f"Type: {entry_info['type']}")
-        print(f"Description: {entry_info['description'][:100]}...")
-        print(f"Current keys: {len(entry_info['current_keys'])}")
-        print(f"{'='*60}")
+        prompt = self.create_generation_prompt(entry_info)
         
-        try:
-            result = await self.api.high_level.generate(
-                prompt,
-                Model.Kayra,
-                preset,
-                global_settings
-            )
-            
-            # Decode the result
-            generated_tokens = b64_to_tokens(result["output"], 2)  # Kayra uses 2 bytes per token
-            generated_text = Tokenizer.decode(Model.Kayra, generated_tokens)
+        # Regenerate/retry loops back here, reusing the same prompt
+        while True:
+            print(f"\n{'='*60}")
+            print(f"Entry: {entry_info['display_name']}")
+            print(f"Type: {entry_info['type']}")
+            print(f"Description: {entry_info['description'][:100]}...")
+            print(f"Current keys: {len(entry_info['current_keys'])}")
+            print(f"{'='*60}")
             
-            print(f"AI Response: {generated_text}")
-            
-            # Clean and validate the generated keys
-            cleaned_keys = self.clean_generated_keys(generated_text)
-            
-            if len(cleaned_keys) < self.min_keys:
-                print(f"Warning: Only generated {len(cleaned_keys)} keys (minimum: {self.min_keys})")
-                print("You can:")
+            try:
+                result = await self.api.high_level.generate(
+                    prompt,
+                    Model.Kayra,
+                    self.preset,
+                    self.global_settings
+                )
+                
+                # Decode the result
+                generated_tokens = b64_to_tokens(result["output"], 2)  # Kayra uses 2 bytes per token
+                generated_text = Tokenizer.decode(Model.Kayra, generated_tokens)
+                
+                print(f"AI Response: {generated_text}")
+                
+                # Clean and validate the generated keys
+                cleaned_keys = self.clean_generated_keys(generated_text)
+                
+                if len(cleaned_keys) < self.min_keys:
+                    print(f"Warning: Only generated {len(cleaned_keys)} keys (minimum: {self.min_keys})")
+                    print("You can:")
+                    print("1. Accept these keys and continue")
+                    print("2. Regenerate this entry")
+                    print("3. Skip this entry")
+                    print("4. Retry this entry")
+                    
+                    choice = input("Your choice (1/2/3/4): ").strip()
+                    if choice == '2':
+                        continue
+                    elif choice == '3':
+                        return entry_info['current_keys']  # Return existing keys
+                    elif choice == '4':
+                        continue
+                    elif choice != '1':
+                        print("Invalid choice. Continuing with generated keys...")
+                
+                print(f"Generated {len(cleaned_keys)} keys: {', '.join(cleaned_keys)}")
+                
+                # Always provide user options
+                print("\nYou can:")
                 print("1. Accept these keys and continue")
                 print("2. Regenerate this entry")
                 print("3. Skip this entry")
@@ -201,65 +281,47 @@ Tags:"""
                 
                 choice = input("Your choice (1/2/3/4): ").strip()
                 if choice == '2':
-                    return await self.generate_keys_for_entry(entry_info)
+                    continue
                 elif choice == '3':
                     return entry_info['current_keys']  # Return existing keys
                 elif choice == '4':
-                    return await self.generate_keys_for_entry(entry_info)
+                    continue
                 elif choice != '1':
                     print("Invalid choice. Continuing with generated keys...")
-            
-            print(f"Generated {len(cleaned_keys)} keys: {', '.join(cleaned_keys)}")
-            
-            # Always provide user options
-            print("\nYou can:")
-            print("1. Accept these keys and continue")
-            print("2. Regenerate this entry")
-            print("3. Skip this entry")
-            print("4. Retry this entry")
-            
-            choice = input("Your choice (1/2/3/4): ").strip()
-            if choice == '2':
-                return await self.generate_keys_for_entry(entry_info)
-            elif choice == '3':
-                return entry_info['current_keys']  # Return existing keys
-            elif choice == '4':
-                return await self.generate_keys_for_entry(entry_info)
-            elif choice != '1':
-                print("Invalid choice. Continuing with generated keys...")
-            
-            return cleaned_keys
-            
-        except Exception as e:
-            print(f"Error generating keys: {e}")
-            return entry_info['current_keys']  # Return existing keys on error
+                
+                return cleaned_keys
+                
+            except Exception as e:
+                print(f"Error generating keys: {e}")
+                return entry_info['current_keys']  # Return existing keys on error
             
     async def process_lorebook(self, input_file, output_file):
         """Process the entire lorebook"""
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                lorebook = json.load(f)
+            with open(input_file, 'rb') as f:
+                data = f.read()
+            lorebook = orjson.loads(data) if orjson else json.loads(data)
         except Exception as e:
             print(f"Error reading lorebook: {e}")
             return
             
-        print(f"\nProcessing {len(lorebook['entries'])} entries...")
+        entries = lorebook['entries']
+        total = len(entries)
+        print(f"\nProcessing {total} entries...")
         
-        processed_entries = []
         entries_updated = 0
         
-        for i, entry in enumerate(lorebook['entries']):
-            entry_info = self.extract_entry_info(entry)
-            current_keys = entry_info['current_keys']
+        for i, entry in enumerate(entries):
+            current_keys = entry.get('keys', [])
             
-            # Check if entry needs new keys
+            # Check if entry needs new keys (before parsing its text)
             if len(current_keys) >= self.min_keys:
-                print(f"\nEntry {i+1}/{len(lorebook['entries'])}: '{entry_info['display_name']}' - Already has {len(current_keys)} keys")
-                processed_entries.append(entry)
+                print(f"\nEntry {i+1}/{total}: '{entry.get('displayName', '')}' - Already has {len(current_keys)} keys")
                 continue
                 
             # Entry needs keys generation
-            print(f"\nEntry {i+1}/{len(lorebook['entries'])}: '{entry_info['display_name']}' - Needs keys")
+            entry_info = self.extract_entry_info(entry)
+            print(f"\nEntry {i+1}/{total}: '{entry_info['display_name']}' - Needs keys")
             
             # Wait for user initiation (NovelAI requirement)
             input("Press Enter to initiate key generation for this entry...")
@@ -267,11 +329,9 @@ Tags:"""
             # Generate keys
             new_keys = await self.generate_keys_for_entry(entry_info)
             
-            # Update the entry with new keys
-            updated_entry = entry.copy()
-            updated_entry['keys'] = new_keys
-            updated_entry['lastUpdatedAt'] = int(datetime.now().timestamp() * 1000)
-            processed_entries.append(updated_entry)
+            # Update the entry with new keys (in place, the loaded lorebook is ours)
+            entry['keys'] = new_keys
+            entry['lastUpdatedAt'] = time.time_ns() // 1_000_000
             entries_updated += 1
             
             # Update entry_info for next iteration
@@ -279,20 +339,20 @@ Tags:"""
             
             print(f"✓ Keys updated for '{entry_info['display_name']}'")
         
-        # Create the new lorebook
-        new_lorebook = {
-            "lorebookVersion": lorebook.get("lorebookVersion", 6),
-            "entries": processed_entries,
-            "categories": lorebook.get("categories", []),
-            "settings": lorebook.get("settings", {})
-        }
-        
-        # Save the updated lorebook
+        # Save the updated lorebook (entries were updated in place), filling in
+        # the top-level fields a minimal input may leave out
+        lorebook.setdefault("lorebookVersion", 6)
+        lorebook.setdefault("categories", [])
+        lorebook.setdefault("settings", {})
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(new_lorebook, f, indent=2, ensure_ascii=False)
+            if orjson:
+                data = orjson.dumps(lorebook, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(lorebook, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(output_file, 'wb') as f:
+                f.write(data)
             print(f"\n✓ Updated lorebook saved to: {output_file}")
-            print(f"✓ Processed {len(lorebook['entries'])} entries, updated {entries_updated} entries")
+            print(f"✓ Processed {total} entries, updated {entries_updated} entries")
         except Exception as e:
             print(f"Error saving lorebook: {e}")
 
@@ -11,28 +11,200 @@ Usage:
     python lorebook_converter.py input.txt output.lorebook  # Convert TXT to JSON with custom output
 """
 
+import contextlib
 import json
+import mmap
+import os
+import stat
 import argparse
 import sys
 import re
-import uuid
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read everything left in fd with os.read.
+    
+    st_size is only a hint for the first read: pipes and FIFOs report 0, and
+    a single read can come up short, so reading stops at end of file.
+    """
+    bufsize = max(os.fstat(fd).st_size + 1, 1 << 16)
+    chunks = []
+    while True:
+        chunk = os.read(fd, bufsize)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file with os.read, bypassing the buffered/text io layers."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return _read_fd(fd)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def _open_for_replace(path: str, **kwargs) -> Iterator[TextIO]:
+    """Open path for text writing via a temp file that replaces it on success.
+    
+    If writing fails part-way, the temp file is removed and nothing (or the
+    previous file) is left at path, instead of a truncated file. Symlinks are
+    followed, so the file they point to is the one replaced.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    
+    # Devices and pipes (e.g. /dev/stdout) cannot be replaced, and replacing a
+    # hard-linked file would split it from its other names; write to those directly
+    direct = st is not None and (not stat.S_ISREG(st.st_mode) or st.st_nlink > 1)
+    if not direct:
+        path = os.path.realpath(path)
+        directory = os.path.dirname(path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+        except OSError:
+            # No temp file possible next to the output (e.g. read-only directory)
+            direct = True
+    
+    if direct:
+        with open(path, 'w', **kwargs) as f:
+            yield f
+        return
+    
+    try:
+        with open(fd, 'w', **kwargs) as f:
+            yield f
+        
+        # mkstemp creates the file 0600; give it the mode open() would have
+        if st is not None:
+            mode = stat.S_IMODE(st.st_mode)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _new_id() -> str:
+    """Return a random (version 4) UUID string without building a uuid.UUID."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, letting orjson read it straight from a memory map."""
+    if orjson:
+        with open(path, 'rb') as f:
+            fd = f.fileno()
+            st = os.fstat(fd)
+            # mmap only works on non-empty regular files; anything else (pipes,
+            # FIFOs, empty files) is read from the same descriptor
+            if stat.S_ISREG(st.st_mode) and st.st_size:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(_read_fd(fd))
+    return json.loads(_read_file(path))
+
+
+def _parse_bool(value: str) -> bool:
+    # Exported files always say True/False; only odd casings need lower()
+    return value == 'True' or (len(value) == 4 and value.lower() == 'true')
+
+
+def _parse_keys(value: str) -> List[str]:
+    return [k.strip() for k in value.split(',')]
+
+
+# Shared read-only default for missing mappings; never mutated
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Template for new entries and categories; all values are immutable, so a
+# shallow copy is enough
+_DEFAULT_CONTEXT_CONFIG = {
+    'prefix': '',
+    'suffix': '\n',
+    'tokenBudget': 100,
+    'reservedTokens': 0,
+    'budgetPriority': 400,
+    'trimDirection': 'trimBottom',
+    'insertionType': 'newline',
+    'maximumTrimType': 'sentence',
+    'insertionPosition': -1
+}
+
+_SECTION_HEADERS = {
+    'CATEGORIES': 'categories',
+    'LORE ENTRIES': 'entries',
+    'SETTINGS': 'settings',
+}
+
+# Headings that open each block of an entry
+_ENTRY_BLOCKS = {
+    'CONTENT:': 'content',
+    'CONTEXT CONFIGURATION:': 'context',
+    'ADVANCED CONDITIONS:': 'advanced',
+    'LORE BIAS GROUPS:': 'bias',
+}
+
+# "Label: value" lines mapped to (field, parser), looked up by label so each line
+# is split once instead of being tested against every prefix in turn
+_CATEGORY_FIELDS = {
+    'ID': ('id', str),
+    'Enabled': ('enabled', _parse_bool),
+    'Creates Subcontext': ('createSubcontext', _parse_bool),
+}
+
+_ENTRY_FIELDS = {
+    'Display Name': ('displayName', str),
+    'ID': ('id', str),
+    'Activation Keys': ('keys', _parse_keys),
+    'Enabled': ('enabled', _parse_bool),
+    'Force Activation': ('forceActivation', _parse_bool),
+    'Search Range': ('searchRange', int),
+}
+
+_CONTEXT_CONFIG_FIELDS = {
+    'Token Budget': ('tokenBudget', int),
+    'Budget Priority': ('budgetPriority', int),
+    'Trim Direction': ('trimDirection', str),
+}
 
 
 class LorebookConverter:
     """Handles conversion between NovelAI lorebook JSON and TXT formats."""
     
-    def __init__(self):
+    def __init__(self, quiet: bool = False):
         self.category_map = {}  # Maps category names to IDs
         self.reverse_category_map = {}  # Maps category IDs to names
+        self.quiet = quiet  # Skip success messages; errors are still printed
     
     def json_to_txt(self, input_file: str, output_file: Optional[str] = None) -> str:
         """Convert a .lorebook JSON file to a readable TXT file."""
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                lorebook = json.load(f)
+            lorebook = _load_json_file(input_file)
         except FileNotFoundError:
             print(f"Error: Input file '{input_file}' not found.")
             sys.exit(1)
@@ -40,8 +212,11 @@ class LorebookConverter:
             print(f"Error: Invalid JSON in '{input_file}': {e}")
             sys.exit(1)
         
-        # Build category mappings
-        for category in lorebook.get('categories', []):
+        # Build category mappings (fresh for each file, so nothing leaks from a
+        # previous conversion)
+        self.category_map = {}
+        self.reverse_category_map = {}
+        for category in lorebook.get('categories') or ():
             self.reverse_category_map[category['id']] = category['name']
         
         # Generate output filename if not provided
@@ -49,21 +224,23 @@ class LorebookConverter:
             input_path = Path(input_file)
             output_file = str(input_path.with_suffix('.txt'))
         
-        # Generate TXT content
-        txt_content = self._generate_txt_content(lorebook)
+        # Write TXT content straight to the file (1 MiB buffer keeps writes large);
+        # it only replaces output_file once the whole export has been written
+        with _open_for_replace(output_file, encoding='utf-8', buffering=1 << 20) as f:
+            self._generate_txt_content(lorebook, f)
         
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(txt_content)
-        
-        print(f"Successfully converted '{input_file}' to '{output_file}'")
+        if not self.quiet:
+            print(f"Successfully converted '{input_file}' to '{output_file}'")
         return output_file
     
-    def txt_to_json(self, input_file: str, output_file: Optional[str] = None) -> str:
-        """Convert a TXT file back to a .lorebook JSON file."""
+    def txt_to_json(self, input_file: str, output_file: Optional[str] = None, compact: bool = False) -> str:
+        """Convert a TXT file back to a .lorebook JSON file.
+        
+        With compact set, the JSON is written without indentation, which is
+        smaller and faster to write when nobody needs to read the file.
+        """
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                txt_content = f.read()
+            txt_content = _read_file(input_file).decode('utf-8')
         except FileNotFoundError:
             print(f"Error: Input file '{input_file}' not found.")
             sys.exit(1)
@@ -77,147 +254,159 @@ class LorebookConverter:
             output_file = str(input_path.with_suffix('.lorebook'))
         
         # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(lorebook, f, indent=2, ensure_ascii=False)
+        if orjson:
+            option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            data = orjson.dumps(lorebook, option=option)
+        elif compact:
+            data = json.dumps(lorebook, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        else:
+            data = json.dumps(lorebook, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(output_file, 'wb') as f:
+            f.write(data)
         
-        print(f"Successfully converted '{input_file}' to '{output_file}'")
+        if not self.quiet:
+            print(f"Successfully converted '{input_file}' to '{output_file}'")
         return output_file
     
-    def _generate_txt_content(self, lorebook: Dict[str, Any]) -> str:
-        """Generate readable TXT content from lorebook JSON."""
-        lines = []
+    def _generate_txt_content(self, lorebook: Dict[str, Any], out: TextIO) -> None:
+        """Write readable TXT content for lorebook JSON to out."""
+        write = out.write
         
         # Header
-        lines.append("=" * 80)
-        lines.append("NOVELAI LOREBOOK")
-        lines.append("=" * 80)
-        lines.append(f"Version: {lorebook.get('lorebookVersion', 6)}")
-        lines.append(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        write("=" * 80 + "\n")
+        write("NOVELAI LOREBOOK\n")
+        write("=" * 80 + "\n")
+        write(f"Version: {lorebook.get('lorebookVersion', 6)}\n")
+        write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write("\n")
         
         # Categories
         if lorebook.get('categories'):
-            lines.append("CATEGORIES")
-            lines.append("-" * 40)
+            write("CATEGORIES\n")
+            write("-" * 40 + "\n")
             for category in lorebook['categories']:
-                lines.append(f"Category: {category['name']}")
-                lines.append(f"ID: {category['id']}")
-                lines.append(f"Enabled: {category.get('enabled', True)}")
+                write(f"Category: {category['name']}\n")
+                write(f"ID: {category['id']}\n")
+                write(f"Enabled: {category.get('enabled', True)}\n")
                 if category.get('createSubcontext', False):
-                    lines.append(f"Creates Subcontext: Yes")
-                lines.append("")
+                    write(f"Creates Subcontext: Yes\n")
+                write("\n")
         
         # Entries
         if lorebook.get('entries'):
-            lines.append("LORE ENTRIES")
-            lines.append("-" * 40)
+            write("LORE ENTRIES\n")
+            write("-" * 40 + "\n")
+            
+            # Bound lookups, hoisted out of the per-entry and per-field calls
+            category_names = self.reverse_category_map.get
             
             for i, entry in enumerate(lorebook['entries'], 1):
-                lines.append(f"ENTRY #{i}")
-                lines.append("=" * 60)
+                get = entry.get
+                write(f"ENTRY #{i}\n")
+                write("=" * 60 + "\n")
                 
                 # Basic info
-                lines.append(f"Display Name: {entry['displayName']}")
-                lines.append(f"ID: {entry['id']}")
+                write(f"Display Name: {entry['displayName']}\n")
+                write(f"ID: {entry['id']}\n")
                 
                 # Category
-                category_id = entry.get('category', '')
-                category_name = self.reverse_category_map.get(category_id, 'Unknown')
-                lines.append(f"Category: {category_name} ({category_id})")
+                category_id = get('category', '')
+                category_name = category_names(category_id, 'Unknown')
+                write(f"Category: {category_name} ({category_id})\n")
                 
                 # Keys
-                keys = entry.get('keys', [])
-                lines.append(f"Activation Keys: {', '.join(keys)}")
+                keys = get('keys') or ()
+                write(f"Activation Keys: {', '.join(keys)}\n")
                 
                 # Status
-                lines.append(f"Enabled: {entry.get('enabled', True)}")
-                lines.append(f"Force Activation: {entry.get('forceActivation', False)}")
-                lines.append(f"Search Range: {entry.get('searchRange', 1000)}")
+                write(f"Enabled: {get('enabled', True)}\n")
+                write(f"Force Activation: {get('forceActivation', False)}\n")
+                write(f"Search Range: {get('searchRange', 1000)}\n")
                 
                 # Content
-                lines.append("")
-                lines.append("CONTENT:")
-                lines.append("-" * 20)
+                write("\n")
+                write("CONTENT:\n")
+                write("-" * 20 + "\n")
                 
                 # Parse the text field to extract title and description
-                text = entry.get('text', '')
+                text = get('text', '')
                 if text.startswith('----\n'):
                     text_parts = text.split('\n', 2)
                     if len(text_parts) >= 3:
                         title = text_parts[1]
                         description = text_parts[2]
-                        lines.append(f"Title: {title}")
-                        lines.append(f"Description: {description}")
+                        write(f"Title: {title}\n")
+                        write(f"Description: {description}\n")
                     else:
-                        lines.append(text)
+                        write(f"{text}\n")
                 else:
-                    lines.append(text)
+                    write(f"{text}\n")
                 
                 # Context Configuration
-                context_config = entry.get('contextConfig', {})
-                lines.append("")
-                lines.append("CONTEXT CONFIGURATION:")
-                lines.append("-" * 25)
+                context_config = get('contextConfig') or _EMPTY_DICT
+                cc_get = context_config.get
+                write("\n")
+                write("CONTEXT CONFIGURATION:\n")
+                write("-" * 25 + "\n")
                 
-                if context_config.get('prefix'):
-                    lines.append(f"Prefix: {repr(context_config['prefix'])}")
+                if cc_get('prefix'):
+                    write(f"Prefix: {repr(context_config['prefix'])}\n")
                 else:
-                    lines.append("Prefix: ''")
+                    write("Prefix: ''\n")
                     
-                if context_config.get('suffix'):
-                    lines.append(f"Suffix: {repr(context_config['suffix'])}")
+                if cc_get('suffix'):
+                    write(f"Suffix: {repr(context_config['suffix'])}\n")
                 else:
-                    lines.append("Suffix: '\\n'")
+                    write("Suffix: '\\n'\n")
                     
-                lines.append(f"Token Budget: {context_config.get('tokenBudget', 100)}")
-                lines.append(f"Budget Priority: {context_config.get('budgetPriority', 400)}")
-                lines.append(f"Trim Direction: {context_config.get('trimDirection', 'trimBottom')}")
+                write(f"Token Budget: {cc_get('tokenBudget', 100)}\n")
+                write(f"Budget Priority: {cc_get('budgetPriority', 400)}\n")
+                write(f"Trim Direction: {cc_get('trimDirection', 'trimBottom')}\n")
                 
                 # Advanced Conditions
-                advanced_conditions = entry.get('advancedConditions', [])
-                lines.append("")
-                lines.append("ADVANCED CONDITIONS:")
-                lines.append("-" * 22)
+                advanced_conditions = get('advancedConditions') or ()
+                write("\n")
+                write("ADVANCED CONDITIONS:\n")
+                write("-" * 22 + "\n")
                 if advanced_conditions:
                     for condition in advanced_conditions:
-                        lines.append(f"  Type: {condition.get('type', 'unknown')}")
-                        lines.append(f"  Key: {condition.get('key', '')}")
-                        lines.append(f"  Range: {condition.get('range', 0)}")
-                        lines.append("")
+                        write(f"  Type: {condition.get('type', 'unknown')}\n")
+                        write(f"  Key: {condition.get('key', '')}\n")
+                        write(f"  Range: {condition.get('range', 0)}\n")
+                        write("\n")
                 else:
-                    lines.append("  (No advanced conditions)")
+                    write("  (No advanced conditions)\n")
                 
                 # Lore Bias Groups
-                bias_groups = entry.get('loreBiasGroups', [])
-                lines.append("")
-                lines.append("LORE BIAS GROUPS:")
-                lines.append("-" * 18)
+                bias_groups = get('loreBiasGroups') or ()
+                write("\n")
+                write("LORE BIAS GROUPS:\n")
+                write("-" * 18 + "\n")
                 if bias_groups:
                     for bias in bias_groups:
                         if bias.get('phrases'):
-                            lines.append(f"  Phrases: {', '.join(bias['phrases'])}")
-                        lines.append(f"  Bias: {bias.get('bias', 0)}")
-                        lines.append(f"  Enabled: {bias.get('enabled', True)}")
-                        lines.append("")
+                            write(f"  Phrases: {', '.join(bias['phrases'])}\n")
+                        write(f"  Bias: {bias.get('bias', 0)}\n")
+                        write(f"  Enabled: {bias.get('enabled', True)}\n")
+                        write("\n")
                 else:
-                    lines.append("  (No lore bias groups)")
+                    write("  (No lore bias groups)\n")
                 
-                lines.append("")
-                lines.append("")
+                write("\n")
+                write("\n")
         
         # Settings
-        settings = lorebook.get('settings', {})
+        settings = lorebook.get('settings') or _EMPTY_DICT
         if settings:
-            lines.append("SETTINGS")
-            lines.append("-" * 40)
+            write("SETTINGS\n")
+            write("-" * 40 + "\n")
             for key, value in settings.items():
-                lines.append(f"{key}: {value}")
-        
-        return '\n'.join(lines)
+                write(f"{key}: {value}\n")
     
     def _parse_txt_content(self, txt_content: str) -> Dict[str, Any]:
         """Parse TXT content back to lorebook JSON format."""
-        lines = txt_content.split('\n')
+        # Strip every line once up front
+        lines = [line.strip() for line in txt_content.split('\n')]
         
         lorebook = {
             'lorebookVersion': 6,
@@ -228,50 +417,61 @@ class LorebookConverter:
             }
         }
         
+        # Category lookups by name and by ID for this file
+        self.category_map = {}
+        self.reverse_category_map = {}
+        
         current_section = None
         current_entry = None
         current_category = None
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        # Which part of the current entry we are in (header, content, context,
+        # advanced or bias) and the lines collected for its CONTENT block
+        entry_block = None
+        content_lines = []
+        
+        # All entries from one conversion share a single timestamp
+        now_ms = int(datetime.now().timestamp() * 1000)
+        
+        for line in lines:
+            # Content is free text; collect it verbatim until a marker closes it
+            if entry_block == 'content':
+                if not (line in _ENTRY_BLOCKS or line in _SECTION_HEADERS or line.startswith('ENTRY #')):
+                    content_lines.append(line)
+                    continue
+                self._set_entry_text(current_entry, content_lines)
+                entry_block = None
             
             # Skip empty lines and separators
-            if not line or line.startswith('=') or line.startswith('-'):
-                i += 1
+            if not line or line[0] in '=-':
                 continue
             
+            # Split "Label: value" lines once; the label picks the handler below
+            key, sep, value = line.partition(':')
+            value = value.strip()
+            
             # Parse header information
-            if line.startswith('Version:'):
+            if sep and key == 'Version':
                 try:
-                    lorebook['lorebookVersion'] = int(line.split(':', 1)[1].strip())
-                except:
+                    lorebook['lorebookVersion'] = int(value)
+                except ValueError:
                     pass
-                i += 1
                 continue
             
             # Section headers
-            if line == 'CATEGORIES':
-                current_section = 'categories'
-                i += 1
-                continue
-            elif line == 'LORE ENTRIES':
-                current_section = 'entries'
-                i += 1
-                continue
-            elif line == 'SETTINGS':
-                current_section = 'settings'
-                i += 1
+            section = _SECTION_HEADERS.get(line)
+            if section:
+                current_section = section
                 continue
             
             # Parse based on current section
             if current_section == 'categories':
-                if line.startswith('Category:'):
+                if sep and key == 'Category':
                     if current_category:
-                        lorebook['categories'].append(current_category)
+                        self._add_category(current_category, lorebook)
                     current_category = {
-                        'name': line.split(':', 1)[1].strip(),
-                        'id': str(uuid.uuid4()),
+                        'name': value,
+                        'id': _new_id(),
                         'enabled': True,
                         'createSubcontext': False,
                         'subcontextSettings': self._get_default_context_config(),
@@ -280,12 +480,9 @@ class LorebookConverter:
                         'categoryBiasGroups': [],
                         'settings': {}
                     }
-                elif line.startswith('ID:') and current_category:
-                    current_category['id'] = line.split(':', 1)[1].strip()
-                elif line.startswith('Enabled:') and current_category:
-                    current_category['enabled'] = line.split(':', 1)[1].strip().lower() == 'true'
-                elif line.startswith('Creates Subcontext:') and current_category:
-                    current_category['createSubcontext'] = line.split(':', 1)[1].strip().lower() == 'true'
+                elif sep and current_category and key in _CATEGORY_FIELDS:
+                    field, parse = _CATEGORY_FIELDS[key]
+                    current_category[field] = parse(value)
             
             elif current_section == 'entries':
                 if line.startswith('ENTRY #'):
@@ -297,9 +494,9 @@ class LorebookConverter:
                     current_entry = {
                         'text': '',
                         'contextConfig': self._get_default_context_config(),
-                        'lastUpdatedAt': int(datetime.now().timestamp() * 1000),
+                        'lastUpdatedAt': now_ms,
                         'displayName': '',
-                        'id': str(uuid.uuid4()),
+                        'id': _new_id(),
                         'keys': [],
                         'searchRange': 1000,
                         'enabled': True,
@@ -310,14 +507,30 @@ class LorebookConverter:
                         'loreBiasGroups': [],
                         'advancedConditions': []
                     }
+                    entry_block = 'header'
                 
-                elif current_entry:
-                    if line.startswith('Display Name:'):
-                        current_entry['displayName'] = line.split(':', 1)[1].strip()
-                    elif line.startswith('ID:'):
-                        current_entry['id'] = line.split(':', 1)[1].strip()
-                    elif line.startswith('Category:'):
-                        category_line = line.split(':', 1)[1].strip()
+                elif current_entry and line in _ENTRY_BLOCKS:
+                    entry_block = _ENTRY_BLOCKS[line]
+                    if entry_block == 'content':
+                        content_lines = []
+                
+                # Advanced conditions and bias groups are not read back, so their
+                # Enabled/Type lines must not land on the entry itself
+                elif current_entry and sep and entry_block in ('header', 'context'):
+                    if key in _ENTRY_FIELDS:
+                        field, parse = _ENTRY_FIELDS[key]
+                        try:
+                            current_entry[field] = parse(value)
+                        except ValueError:
+                            pass
+                    elif key in _CONTEXT_CONFIG_FIELDS:
+                        field, parse = _CONTEXT_CONFIG_FIELDS[key]
+                        try:
+                            current_entry['contextConfig'][field] = parse(value)
+                        except ValueError:
+                            pass
+                    elif key == 'Category':
+                        category_line = value
                         # Extract category name (before parentheses)
                         if '(' in category_line:
                             category_name = category_line.split('(')[0].strip()
@@ -326,95 +539,77 @@ class LorebookConverter:
                             category_name = category_line
                             category_id = self._find_or_create_category_id(category_name, lorebook)
                         current_entry['category'] = category_id
-                    elif line.startswith('Activation Keys:'):
-                        keys_str = line.split(':', 1)[1].strip()
-                        current_entry['keys'] = [k.strip() for k in keys_str.split(',')]
-                    elif line.startswith('Enabled:'):
-                        current_entry['enabled'] = line.split(':', 1)[1].strip().lower() == 'true'
-                    elif line.startswith('Force Activation:'):
-                        current_entry['forceActivation'] = line.split(':', 1)[1].strip().lower() == 'true'
-                    elif line.startswith('Search Range:'):
-                        try:
-                            current_entry['searchRange'] = int(line.split(':', 1)[1].strip())
-                        except:
-                            pass
-                    elif line.startswith('Title:'):
-                        title = line.split(':', 1)[1].strip()
-                        # Look ahead for description
-                        description = ''
-                        j = i + 1
-                        while j < len(lines) and not lines[j].strip().startswith(('=', '-', 'CONTEXT', 'ADVANCED', 'LORE')):
-                            if lines[j].strip().startswith('Description:'):
-                                description = lines[j].strip().split(':', 1)[1].strip()
-                                # Remove "Type: " prefix if it exists in description
-                                if description.startswith('Type: '):
-                                    description = description.split('\n', 1)[1] if '\n' in description else ''
-                                break
-                            j += 1
-                        current_entry['text'] = f"----\n{title}\nType: {self._get_category_name(current_entry['category'], lorebook)}\n{description}"
-                    elif line.startswith('Token Budget:'):
-                        try:
-                            current_entry['contextConfig']['tokenBudget'] = int(line.split(':', 1)[1].strip())
-                        except:
-                            pass
-                    elif line.startswith('Budget Priority:'):
-                        try:
-                            current_entry['contextConfig']['budgetPriority'] = int(line.split(':', 1)[1].strip())
-                        except:
-                            pass
-                    elif line.startswith('Trim Direction:'):
-                        current_entry['contextConfig']['trimDirection'] = line.split(':', 1)[1].strip()
+                    elif key == 'Title':
+                        # Hand-written files may leave out the CONTENT: heading
+                        entry_block = 'content'
+                        content_lines = [line]
             
             elif current_section == 'settings':
-                if ':' in line:
-                    key, value = line.split(':', 1)
+                if sep:
                     key = key.strip()
-                    value = value.strip()
+                    value_lower = value.lower()
                     
                     # Try to convert to appropriate type
-                    if value.lower() == 'true':
+                    if value_lower == 'true':
                         lorebook['settings'][key] = True
-                    elif value.lower() == 'false':
+                    elif value_lower == 'false':
                         lorebook['settings'][key] = False
                     elif value.isdigit():
                         lorebook['settings'][key] = int(value)
                     else:
                         lorebook['settings'][key] = value
-            
-            i += 1
         
         # Add final entry and category
+        if entry_block == 'content':
+            self._set_entry_text(current_entry, content_lines)
         if current_entry:
             lorebook['entries'].append(current_entry)
         if current_category:
-            lorebook['categories'].append(current_category)
+            self._add_category(current_category, lorebook)
         
         return lorebook
     
+    def _set_entry_text(self, entry: Dict[str, Any], content_lines: List[str]) -> None:
+        """Rebuild an entry's text from the lines of its CONTENT block."""
+        # Drop the rule under the CONTENT: heading and the blank line after the block
+        start = 1 if content_lines and content_lines[0] and not content_lines[0].strip('-') else 0
+        end = len(content_lines)
+        while end > start and not content_lines[end - 1]:
+            end -= 1
+        content_lines = content_lines[start:end]
+        
+        if not content_lines or not content_lines[0].startswith('Title:'):
+            entry['text'] = '\n'.join(content_lines)
+            return
+        
+        title = content_lines[0].split(':', 1)[1].strip()
+        description = ''
+        for j in range(1, len(content_lines)):
+            if content_lines[j].startswith('Description:'):
+                content_lines[j] = content_lines[j].split(':', 1)[1].strip()
+                description = '\n'.join(content_lines[j:])
+                break
+        
+        # Remove "Type: " line if the description starts with one; the type
+        # comes from the entry's category
+        if description.startswith('Type: '):
+            description = description.split('\n', 1)[1] if '\n' in description else ''
+        entry['text'] = f"----\n{title}\nType: {self._get_category_name(entry['category'])}\n{description}"
+    
     def _get_default_context_config(self) -> Dict[str, Any]:
         """Get default context configuration."""
-        return {
-            'prefix': '',
-            'suffix': '\n',
-            'tokenBudget': 100,
-            'reservedTokens': 0,
-            'budgetPriority': 400,
-            'trimDirection': 'trimBottom',
-            'insertionType': 'newline',
-            'maximumTrimType': 'sentence',
-            'insertionPosition': -1
-        }
+        return _DEFAULT_CONTEXT_CONFIG.copy()
     
     def _find_or_create_category_id(self, category_name: str, lorebook: Dict[str, Any]) -> str:
         """Find category ID by name or create a new one."""
-        for category in lorebook.get('categories', []):
-            if category['name'] == category_name:
-                return category['id']
+        category_id = self.category_map.get(category_name)
+        if category_id is not None:
+            return category_id
         
         # Create new category
         new_category = {
             'name': category_name,
-            'id': str(uuid.uuid4()),
+            'id': _new_id(),
             'enabled': True,
             'createSubcontext': False,
             'subcontextSettings': self._get_default_context_config(),
@@ -423,15 +618,19 @@ class LorebookConverter:
             'categoryBiasGroups': [],
             'settings': {}
         }
-        lorebook['categories'].append(new_category)
+        self._add_category(new_category, lorebook)
         return new_category['id']
     
-    def _get_category_name(self, category_id: str, lorebook: Dict[str, Any]) -> str:
+    def _add_category(self, category: Dict[str, Any], lorebook: Dict[str, Any]) -> None:
+        """Add a category to the lorebook and to the name/ID lookups."""
+        lorebook['categories'].append(category)
+        # The first category with a given name or ID wins, as in the lorebook order
+        self.category_map.setdefault(category['name'], category['id'])
+        self.reverse_category_map.setdefault(category['id'], category['name'])
+    
+    def _get_category_name(self, category_id: str) -> str:
         """Get category name by ID."""
-        for category in lorebook.get('categories', []):
-            if category['id'] == category_id:
-                return category['name']
-        return 'Unknown'
+        return self.reverse_category_map.get(category_id, 'Unknown')
 
 
 def main():
@@ -444,6 +643,8 @@ Examples:
   %(prog)s lorebook.lorebook              # Convert JSON to TXT
   %(prog)s lorebook.txt --to-json         # Convert TXT to JSON
   %(prog)s lorebook.txt output.lorebook   # Convert TXT to JSON with custom output
+  %(prog)s lorebook.txt --compact         # Convert TXT to JSON without indentation
+  %(prog)s lorebook.lorebook --quiet      # Convert without printing a success message
         """
     )
     
@@ -451,10 +652,14 @@ Examples:
     parser.add_argument('output_file', nargs='?', help='Output file path (optional)')
     parser.add_argument('--to-json', action='store_true', 
                        help='Force conversion to JSON format (from TXT)')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write JSON without indentation (smaller, faster to write)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Do not print a message on success (errors are still shown)')
     
     args = parser.parse_args()
     
-    converter = LorebookConverter()
+    converter = LorebookConverter(quiet=args.quiet)
     
     # Determine conversion direction
     input_path = Path(args.input_file)
@@ -465,7 +670,7 @@ Examples:
         if not output_file and not args.to_json:
             # If input is .txt but no --to-json flag, assume user wants JSON
             output_file = str(input_path.with_suffix('.lorebook'))
-        converter.txt_to_json(args.input_file, output_file)
+        converter.txt_to_json(args.input_file, output_file, compact=args.compact)
     else:
         # Convert JSON to TXT
         converter.json_to_txt(args.input_file, args.output_file)
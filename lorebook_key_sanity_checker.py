@@ -14,13 +14,126 @@ Key improvements:
 - Better handling of "of" patterns
 """
 
+import functools
 import json
 import sys
 import os
 import argparse
 import re
-from typing import List, Dict, Any, Set, Tuple
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Title patterns, compiled once instead of on every call; titles are lowercased
+# before matching, so no case folding is needed
+_COLON_RE = re.compile(r'^([^:]+):')
+_OF_RE = re.compile(r'^([^,]+?)\s+of\s+([^,]+?)(?:\s+.+)?$')
+_AND_RE = re.compile(r'^(.+?)\s+and\s+(.+?)(?:\s+.+)?$')
+_THE_RE = re.compile(r'^([^,]+?)\s+the\s+.+$')
+
+# Value of each "Type:" line in an entry's text
+_TYPE_RE = re.compile(r'^Type:(.*)$', re.MULTILINE)
+
+# Common prefixes to strip from names
+_NAME_PREFIXES = (
+    'the ', 'a ', 'an ', 'lord ', 'lady ', 'king ', 'queen ', 'prince ', 'princess ',
+    'duke ', 'duchess ', 'sir ', 'master ', 'mistress ', 'captain ', 'general ',
+    'elder ', 'high ', 'grand ', 'arch-', 'chief ', 'head '
+)
+
+# Common suffixes to strip from names
+_NAME_SUFFIXES = (
+    ' the great', ' the wise', ' the bold', ' the strong', ' the brave', ' the mighty',
+    ' the old', ' the young', ' the elder', ' the younger', ' i', ' ii', ' iii', ' iv',
+    ' v', ' vi', ' vii', ' viii', ' ix', ' x', ' jr', ' sr', ' senior', ' junior'
+)
+
+# One anchored alternation per list, so a name is tested in a single regex call
+# rather than one startswith/endswith per affix
+_PREFIX_RE = re.compile('|'.join(map(re.escape, _NAME_PREFIXES)))
+_SUFFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, _NAME_SUFFIXES)) + r')\Z')
+
+# Common English words (for name vs description detection)
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'among', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
+    'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he',
+    'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
+    'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
+    'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than', 'too',
+    'very', 'just', 'now', 'then', 'here', 'there', 'when', 'where',
+    'why', 'how', 'again', 'further', 'once', 'here', 'there',
+    # Additional common words that shouldn't be keys
+    'their', 'your', 'our', 'its', 'his', 'her', 'my', 'yourself', 'himself',
+    'herself', 'itself', 'ourselves', 'themselves', 'myself', 'oneself'
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Cached body of FinalSimpleKeySanityChecker.normalize_name."""
+    if not name:
+        return ""
+    
+    # Convert to lowercase for processing
+    normalized = name.lower().strip()
+    
+    # Remove common prefixes
+    match = _PREFIX_RE.match(normalized)
+    if match:
+        normalized = normalized[match.end():]
+    
+    # Remove common suffixes
+    match = _SUFFIX_RE.search(normalized)
+    if match:
+        normalized = normalized[:match.start()].strip()
+    
+    # Handle plural forms (basic rules)
+    if normalized.endswith('ies'):
+        normalized = normalized[:-3] + 'y'
+    elif normalized.endswith('es') and len(normalized) > 3:
+        normalized = normalized[:-2]
+    elif normalized.endswith('s') and not normalized.endswith('ss'):
+        normalized = normalized[:-1]
+    
+    # Handle specific cases
+    if normalized.endswith('cav'):
+        normalized = normalized[:-3] + 'cave'
+    
+    return normalized.strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_core_name(name: str) -> str:
+    """Cached body of FinalSimpleKeySanityChecker.extract_core_name."""
+    if not name:
+        return ""
+    
+    # Remove common title patterns
+    core_name = name.strip().lower()
+    
+    # Handle patterns like "Name the Adjective"
+    match = _THE_RE.match(core_name)
+    if match:
+        core_name = match.group(1).strip()
+    
+    # Handle patterns like "Name, Title"
+    if ',' in core_name:
+        core_name = core_name.split(',')[0].strip()
+    
+    # Remove prefixes and normalize
+    normalized = _normalize_name(core_name)
+    
+    return normalized
 
 
 class FinalSimpleKeySanityChecker:
@@ -36,36 +149,11 @@ class FinalSimpleKeySanityChecker:
             'race': ['race', 'races', 'species', 'subrace', 'subspecies']
         }
         
-        # Common prefixes to strip from names
-        self.name_prefixes = [
-            'the ', 'a ', 'an ', 'lord ', 'lady ', 'king ', 'queen ', 'prince ', 'princess ',
-            'duke ', 'duchess ', 'sir ', 'master ', 'mistress ', 'captain ', 'general ',
-            'elder ', 'high ', 'grand ', 'arch-', 'chief ', 'head '
-        ]
-        
-        # Common suffixes to strip from names
-        self.name_suffixes = [
-            ' the great', ' the wise', ' the bold', ' the strong', ' the brave', ' the mighty',
-            ' the old', ' the young', ' the elder', ' the younger', ' i', ' ii', ' iii', ' iv',
-            ' v', ' vi', ' vii', ' viii', ' ix', ' x', ' jr', ' sr', ' senior', ' junior'
-        ]
-        
-        # Common English words (for name vs description detection)
-        self.common_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'among', 'is', 'are',
-            'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
-            'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-            'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he',
-            'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
-            'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
-            'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than', 'too',
-            'very', 'just', 'now', 'then', 'here', 'there', 'when', 'where',
-            'why', 'how', 'again', 'further', 'once', 'here', 'there',
-            # Additional common words that shouldn't be keys
-            'their', 'your', 'our', 'its', 'his', 'her', 'my', 'yourself', 'himself',
-            'herself', 'itself', 'ourselves', 'themselves', 'myself', 'oneself'
+        # Synonym -> category, so a type is resolved with one dict lookup
+        self._type_to_category = {
+            synonym: category
+            for category, synonyms in self.type_patterns.items()
+            for synonym in synonyms
         }
     
     def extract_entry_info(self, entry: Dict[str, Any]) -> Tuple[str, str, str]:
@@ -74,77 +162,52 @@ class FinalSimpleKeySanityChecker:
         """
         text = entry.get('text', '')
         display_name = entry.get('displayName', '')
+        entry_type = self.extract_entry_type(entry)
         
-        # Parse the text field to get title and type
-        lines = text.split('\n')
-        title = ""
-        entry_type = ""
-        description = ""
-        
-        for line in lines:
-            if line.startswith('----'):
-                continue
-            elif line.startswith('Type:'):
-                entry_type = line.replace('Type:', '').strip().lower()
-            elif line.strip() and not line.startswith('Type:'):
-                if not title:
-                    title = line.strip()
-                else:
-                    description += line.strip() + " "
+        # Remaining non-blank lines are the title followed by the description
+        lines = [line.strip() for line in text.splitlines() if not line.startswith(('----', 'Type:'))]
+        lines = [line for line in lines if line]
+        title = lines[0] if lines else ""
+        description = ' '.join(lines[1:])
         
         # If no title found in text, use displayName
         if not title and display_name:
             title = display_name
         
-        return title, entry_type, description.strip()
+        return title, entry_type, description
+    
+    def extract_entry_type(self, entry: Dict[str, Any]) -> str:
+        """
+        Extract just the type of a lorebook entry, without parsing the rest of its text.
+        """
+        # The last Type: line wins
+        type_values = _TYPE_RE.findall(entry.get('text', ''))
+        return type_values[-1].strip().lower() if type_values else ""
+    
+    def extract_entry_title(self, entry: Dict[str, Any]) -> str:
+        """
+        Extract just the title of a lorebook entry, stopping at the first title line.
+        """
+        for line in entry.get('text', '').splitlines():
+            if not line.startswith(('----', 'Type:')):
+                line = line.strip()
+                if line:
+                    return line
+        
+        # If no title found in text, use displayName
+        return entry.get('displayName') or ""
     
     def normalize_name(self, name: str) -> str:
         """
         Normalize a name to its singular form by removing common prefixes and suffixes.
         """
-        if not name:
-            return ""
-        
-        # Convert to lowercase for processing
-        normalized = name.lower().strip()
-        
-        # Remove common prefixes
-        for prefix in self.name_prefixes:
-            if normalized.startswith(prefix):
-                normalized = normalized[len(prefix):]
-                break
-        
-        # Remove common suffixes
-        for suffix in self.name_suffixes:
-            if normalized.endswith(suffix):
-                normalized = normalized[:-len(suffix)].strip()
-                break
-        
-        # Handle plural forms (basic rules)
-        if normalized.endswith('ies'):
-            normalized = normalized[:-3] + 'y'
-        elif normalized.endswith('es') and len(normalized) > 3:
-            normalized = normalized[:-2]
-        elif normalized.endswith('s') and not normalized.endswith('ss'):
-            normalized = normalized[:-1]
-        
-        # Handle specific cases
-        if normalized.endswith('cav'):
-            normalized = normalized[:-3] + 'cave'
-        
-        return normalized.strip()
+        return _normalize_name(name)
     
     def get_entry_type_category(self, entry_type: str) -> str:
         """
         Determine the category of an entry type.
         """
-        entry_type_lower = entry_type.lower()
-        
-        for category, synonyms in self.type_patterns.items():
-            if entry_type_lower in synonyms:
-                return category
-        
-        return 'other'
+        return self._type_to_category.get(entry_type.lower(), 'other')
     
     def should_check_entry(self, entry_type: str) -> bool:
         """
@@ -160,6 +223,8 @@ class FinalSimpleKeySanityChecker:
         if not title:
             return []
         
+        # Names come out lowercase anyway, so fold case once up front
+        title = title.lower()
         names = []
         
         # Handle "Name, Title" pattern first (highest priority)
@@ -171,7 +236,7 @@ class FinalSimpleKeySanityChecker:
             return names
         
         # Handle "Name: Subtitle" pattern
-        colon_match = re.match(r'^([^:]+):', title, re.IGNORECASE)
+        colon_match = _COLON_RE.match(title)
         if colon_match:
             core_name = self.extract_core_name(colon_match.group(1).strip())
             if core_name:
@@ -179,14 +244,14 @@ class FinalSimpleKeySanityChecker:
             return names
         
         # Handle "Name of Place" pattern - different logic for locations vs characters
-        of_match = re.match(r'^([^,]+?)\s+of\s+([^,]+?)(?:\s+.+)?$', title, re.IGNORECASE)
+        of_match = _OF_RE.match(title)
         if of_match:
             # Get both parts
             first_part = of_match.group(1).strip()
             second_part = of_match.group(2).strip()
             
             # For locations: prefer second part (likely proper name)
-            if entry_type in ['location', 'locations', 'place', 'area', 'region', 'site', 'spot', 'venue', 'destination']:
+            if self._type_to_category.get(entry_type) == 'location':
                 # Prefer second part (likely proper name) if it's not a common word
                 if not self.is_common_word(second_part):
                     core_place_name = self.extract_core_name(second_part)
@@ -210,7 +275,7 @@ class FinalSimpleKeySanityChecker:
                 return names
         
         # Handle "Name1 and Name2" pattern (multi-character entries) - lowest priority
-        and_match = re.search(r'^(.+?)\s+and\s+(.+?)(?:\s+.+)?$', title, re.IGNORECASE)
+        and_match = _AND_RE.match(title)
         if and_match:
             name1 = and_match.group(1).strip()
             name2 = and_match.group(2).strip()
@@ -237,41 +302,35 @@ class FinalSimpleKeySanityChecker:
         """
         Extract the core name from a title/name.
         """
-        if not name:
-            return ""
-        
-        # Remove common title patterns
-        core_name = name.strip()
-        
-        # Handle patterns like "Name the Adjective"
-        match = re.match(r'^([^,]+?)\s+the\s+.+$', core_name, re.IGNORECASE)
-        if match:
-            core_name = match.group(1).strip()
-        
-        # Handle patterns like "Name, Title"
-        if ',' in core_name:
-            core_name = core_name.split(',')[0].strip()
-        
-        # Remove prefixes and normalize
-        normalized = self.normalize_name(core_name)
-        
-        return normalized
+        return _extract_core_name(name)
     
     def is_common_word(self, word: str) -> bool:
         """
         Check if a word is a common English word.
         """
-        return word.lower() in self.common_words
+        return word.lower() in _COMMON_WORDS
     
-    def is_redundant_key(self, new_key: str, existing_keys: List[str]) -> bool:
+    def is_redundant_key(self, new_key: str, existing_keys: List[str],
+                         existing_lower: Optional[Set[str]] = None,
+                         existing_tokens: Optional[Set[str]] = None) -> bool:
         """
         Check if adding this key would be redundant.
+        
+        existing_lower is the set of lowercased existing_keys and existing_tokens
+        the set of whitespace-separated words in them; callers that test several
+        candidates against the same keys can pass them in.
         """
         new_key_lower = new_key.lower()
+        if existing_lower is None:
+            existing_lower = {key.lower() for key in existing_keys}
         
-        for existing_key in existing_keys:
-            existing_key_lower = existing_key.lower()
-            
+        # Same key in a different case, or a whole word of an existing key
+        if new_key_lower in existing_lower:
+            return True
+        if existing_tokens is not None and new_key_lower in existing_tokens:
+            return True
+        
+        for existing_key_lower in existing_lower:
             # If new key is contained in existing key or vice versa
             if (new_key_lower in existing_key_lower or 
                 existing_key_lower in new_key_lower):
@@ -279,17 +338,27 @@ class FinalSimpleKeySanityChecker:
         
         return False
     
-    def check_and_fix_entry(self, entry: Dict[str, Any]) -> Tuple[Dict[str, Any], bool, List[str]]:
+    def check_and_fix_entry(self, entry: Dict[str, Any], timestamp: Optional[int] = None,
+                            title: Optional[str] = None,
+                            entry_type: Optional[str] = None) -> Tuple[Dict[str, Any], bool, List[str]]:
         """
         Check and fix a single lorebook entry.
+        
+        A fixed entry is updated in place and returned, with lastUpdatedAt set
+        to timestamp (milliseconds; defaults to now). Callers that already have
+        the entry's title and type can pass them to avoid reading them again.
         """
-        title, entry_type, description = self.extract_entry_info(entry)
-        current_keys = entry.get('keys', [])
+        if entry_type is None:
+            entry_type = self.extract_entry_type(entry)
         
         # Skip if this entry type shouldn't be checked
         if not self.should_check_entry(entry_type):
             return entry, False, []
         
+        if title is None:
+            title = self.extract_entry_title(entry)
+        current_keys = entry.get('keys', [])
+        
         # Extract names from title
         names = self.extract_names_from_title(title, entry_type)
         
@@ -298,24 +367,29 @@ class FinalSimpleKeySanityChecker:
         
         changes_made = []
         updated_keys = current_keys.copy()
+        keys_lower = {key.lower() for key in updated_keys}
+        key_tokens = {token for key in keys_lower for token in key.split()}
         was_modified = False
         
         for name in names:
             if not name:
                 continue
+            name_lower = name.lower()
             
             # Skip common words
-            if self.is_common_word(name):
+            if name_lower in _COMMON_WORDS:
                 changes_made.append(f"Skipped common word: '{name}'")
                 continue
             
             # Check if name is already in keys (case-insensitive)
-            name_in_keys = any(name.lower() == key.lower() for key in updated_keys)
+            name_in_keys = name_lower in keys_lower
             
             if not name_in_keys:
                 # Check for redundancy
-                if not self.is_redundant_key(name, updated_keys):
+                if not self.is_redundant_key(name, updated_keys, keys_lower, key_tokens):
                     updated_keys.append(name)
+                    keys_lower.add(name_lower)
+                    key_tokens.update(name_lower.split())
                     changes_made.append(f"Added missing name key: '{name}'")
                     was_modified = True
                 else:
@@ -323,32 +397,55 @@ class FinalSimpleKeySanityChecker:
         
         # Special case: for names ending in "ves", also add singular form with "f"
         # This should check the original title before normalization
-        if title.lower().endswith('ves'):
+        title_lower = title.lower()
+        if title_lower.endswith('ves'):
             # Extract the base name before normalization
-            base_name = title.lower()
+            base_name = title_lower
             if base_name.endswith('ves'):
                 singular_f_form = base_name[:-3] + 'f'
-                # Check if singular form is already in keys
-                singular_f_in_keys = any(singular_f_form.lower() == key.lower() for key in updated_keys)
-                if not singular_f_in_keys and not self.is_redundant_key(singular_f_form, updated_keys):
+                # Check if singular form is already in keys (it is already lowercase)
+                singular_f_in_keys = singular_f_form in keys_lower
+                if not singular_f_in_keys and not self.is_redundant_key(singular_f_form, updated_keys, keys_lower, key_tokens):
                     updated_keys.append(singular_f_form)
                     changes_made.append(f"Added missing name key: '{singular_f_form}'")
         
         if was_modified or len(changes_made) > 0:
-            updated_entry = entry.copy()
-            updated_entry['keys'] = updated_keys
-            updated_entry['lastUpdatedAt'] = int(datetime.now().timestamp() * 1000)
-            return updated_entry, True, changes_made
+            entry['keys'] = updated_keys
+            entry['lastUpdatedAt'] = timestamp if timestamp is not None else int(time.time() * 1000)
+            return entry, True, changes_made
         
         return entry, False, []
     
-    def check_lorebook(self, input_file: str, output_file: str = None, check_only: bool = False) -> None:
+    def check_entry(self, entry: Dict[str, Any],
+                    timestamp: Optional[int] = None) -> Tuple[str, str, Optional[Dict[str, Any]], List[str]]:
+        """
+        Check a single entry for check_lorebook.
+        
+        Returns the title and type for reporting, the checked entry (None if its
+        type is skipped) and the changes made.
+        """
+        # Only the title and type are reported, so the description is never parsed
+        title = self.extract_entry_title(entry)
+        entry_type = self.extract_entry_type(entry)
+        
+        if not self.should_check_entry(entry_type):
+            return title, entry_type, None, []
+        
+        updated_entry, was_modified, changes = self.check_and_fix_entry(entry, timestamp, title, entry_type)
+        return title, entry_type, updated_entry, changes
+    
+    def check_lorebook(self, input_file: str, output_file: str = None, check_only: bool = False,
+                       jobs: int = 1, quiet: bool = False) -> None:
         """
         Check and optionally fix the entire lorebook.
+        
+        With jobs > 1, entries are checked in that many worker processes. With
+        quiet set, only the summary is printed, not a line per entry.
         """
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                lorebook = json.load(f)
+            with open(input_file, 'rb') as f:
+                data = f.read()
+            lorebook = orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
             print(f"Error: Input file '{input_file}' not found.")
             sys.exit(1)
@@ -369,29 +466,44 @@ class FinalSimpleKeySanityChecker:
         total_issues_found = 0
         entries_fixed = 0
         
-        for i, entry in enumerate(entries, 1):
-            title, entry_type, description = self.extract_entry_info(entry)
-            
-            if not self.should_check_entry(entry_type):
-                print(f"Entry {i:3d}: '{title}' - Skipped (type: {entry_type})")
+        # Every entry fixed in this run gets the same lastUpdatedAt
+        run_timestamp = int(time.time() * 1000)
+        
+        # Entries are independent, so with --jobs they are checked in worker
+        # processes; results come back in order and are reported here
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                check = functools.partial(_check_entry_in_worker, self, timestamp=run_timestamp)
+                results = list(executor.map(check, entries, chunksize=64))
+        else:
+            results = (self.check_entry(entry, run_timestamp) for entry in entries)
+        
+        # Per-entry report, written in one go after the loop (left out with --quiet)
+        report = []
+        
+        for i, (entry, (title, entry_type, updated_entry, changes)) in enumerate(zip(entries, results), 1):
+            if updated_entry is None:
+                if not quiet:
+                    report.append(f"Entry {i:3d}: '{title}' - Skipped (type: {entry_type})")
                 processed_entries.append(entry)
                 continue
             
-            updated_entry, was_modified, changes = self.check_and_fix_entry(entry)
-            
             if changes:
                 total_issues_found += len([c for c in changes if not c.startswith("Skipped")])
                 entries_fixed += 1
-                print(f"Entry {i:3d}: '{title}' - ISSUES FOUND")
-                print(f"  Type: {entry_type}")
-                for change in changes:
-                    print(f"  - {change}")
-                print(f"  Current keys: {', '.join(updated_entry['keys'])}")
-            else:
-                print(f"Entry {i:3d}: '{title}' - OK (type: {entry_type})")
+                if not quiet:
+                    report.append(f"Entry {i:3d}: '{title}' - ISSUES FOUND")
+                    report.append(f"  Type: {entry_type}")
+                    report.extend(f"  - {change}" for change in changes)
+                    report.append(f"  Current keys: {', '.join(updated_entry['keys'])}")
+            elif not quiet:
+                report.append(f"Entry {i:3d}: '{title}' - OK (type: {entry_type})")
             
             processed_entries.append(updated_entry)
         
+        if report:
+            sys.stdout.write('\n'.join(report) + '\n')
+        
         print()
         print("="*60)
         if check_only:
@@ -414,8 +526,12 @@ class FinalSimpleKeySanityChecker:
             
             # Save the updated lorebook
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(new_lorebook, f, indent=2, ensure_ascii=False)
+                if orjson:
+                    data = orjson.dumps(new_lorebook, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                else:
+                    data = json.dumps(new_lorebook, indent=2, ensure_ascii=False).encode('utf-8')
+                with open(output_file, 'wb') as f:
+                    f.write(data)
                 print(f"Fixed lorebook saved to: {output_file}")
             except Exception as e:
                 print(f"Error saving lorebook: {e}")
@@ -428,6 +544,12 @@ class FinalSimpleKeySanityChecker:
         print("="*60)
 
 
+def _check_entry_in_worker(checker: FinalSimpleKeySanityChecker, entry: Dict[str, Any],
+                           timestamp: int) -> Tuple[str, str, Optional[Dict[str, Any]], List[str]]:
+    """Picklable entry point for --jobs worker processes."""
+    return checker.check_entry(entry, timestamp)
+
+
 def main():
     """Main function to handle command line arguments and execute sanity check."""
     parser = argparse.ArgumentParser(
@@ -438,6 +560,8 @@ Examples:
   %(prog)s lorebook.lorebook                    # Check and fix, auto-generate output
   %(prog)s lorebook.lorebook fixed.lorebook    # Check and fix with custom output
   %(prog)s lorebook.lorebook --check-only       # Check only, don't modify
+  %(prog)s lorebook.lorebook --jobs 4           # Check entries in 4 processes
+  %(prog)s lorebook.lorebook --quiet            # Print only the summary
         """
     )
     
@@ -446,9 +570,17 @@ Examples:
                        help='Output lorebook file (optional, auto-generated if not provided)')
     parser.add_argument('--check-only', action='store_true',
                        help='Only check for issues, don\'t modify the file')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of worker processes for checking entries (default: 1); only faster with spare CPU cores')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only print the summary, not a line per entry')
     
     args = parser.parse_args()
     
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+    
     # Generate output filename if not provided and not check-only
     if not args.output_file and not args.check_only:
         input_path = os.path.splitext(args.input_file)
@@ -467,7 +599,7 @@ Examples:
     
     # Process the lorebook
     checker = FinalSimpleKeySanityChecker()
-    checker.check_lorebook(args.input_file, output_file, args.check_only)
+    checker.check_lorebook(args.input_file, output_file, args.check_only, args.jobs, args.quiet)
 
 
 if __name__ == "__main__":
@@ -14,8 +14,64 @@ import json
 import sys
 import os
 import argparse
-from typing import List, Dict, Any
-from datetime import datetime
+import re
+import time
+from typing import List, Dict, Any, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Finds the first digit in a key
+_HAS_DIGIT = re.compile(r'\d').search
+
+# Below this many keys, plain substring checks are cheaper than building an automaton
+_AHOCORASICK_MIN_KEYS = 8
+
+# Very common words, which make poor activation keys
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'among', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
+    'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he',
+    'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
+    'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
+    'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than', 'too',
+    'very', 'just', 'now', 'then', 'here', 'there', 'when', 'where',
+    'why', 'how', 'again', 'further', 'once', 'here', 'there'
+})
+
+
+def _keys_in_text(keys_lower: List[str], text_lower: str) -> Set[str]:
+    """
+    Return the keys that occur in the text.
+    
+    With pyahocorasick installed, larger key lists are matched in a single pass
+    over the text instead of one substring scan per key.
+    """
+    if ahocorasick is None or len(keys_lower) < _AHOCORASICK_MIN_KEYS:
+        return {key for key in keys_lower if key in text_lower}
+    
+    automaton = ahocorasick.Automaton()
+    for key in keys_lower:
+        if key:
+            automaton.add_word(key, key)
+    
+    # The empty string occurs in every text
+    found = {''}
+    if len(automaton):
+        automaton.make_automaton()
+        found.update(key for _, key in automaton.iter(text_lower))
+    return found
 
 
 class LorebookKeyReducer:
@@ -40,71 +96,43 @@ class LorebookKeyReducer:
         
         # Convert to lowercase for case-insensitive comparison
         keys_lower = [k.lower() for k in keys]
-        entry_text_lower = entry_text.lower()
-        
-        # Scoring system for keys
-        key_scores = []
-        
-        for i, key in enumerate(keys):
-            key_lower = keys_lower[i]
-            score = 0
-            
-            # Higher score for keys that appear in the entry text
-            if key_lower in entry_text_lower:
-                score += 10
-            
-            # Higher score for longer, more specific keys
-            score += len(key) * 0.5
-            
-            # Lower score for very common words
-            common_words = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-                'before', 'after', 'above', 'below', 'between', 'among', 'is', 'are',
-                'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
-                'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-                'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he',
-                'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
-                'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
-                'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than', 'too',
-                'very', 'just', 'now', 'then', 'here', 'there', 'when', 'where',
-                'why', 'how', 'again', 'further', 'once', 'here', 'there'
-            }
-            
-            if key_lower in common_words:
-                score -= 5
-            
-            # Higher score for keys that contain numbers or special characters (more specific)
-            if any(c.isdigit() for c in key):
-                score += 2
-            
-            # Higher score for compound words (contain spaces or hyphens)
-            if ' ' in key or '-' in key:
-                score += 1
-            
-            # Higher score for proper nouns (starts with capital letter)
-            if key and key[0].isupper():
-                score += 1
-            
-            key_scores.append((score, key, i))
+        keys_in_text = _keys_in_text(keys_lower, entry_text.lower())
         
-        # Sort by score (descending), then by original position (ascending) for tie-breaking
-        key_scores.sort(key=lambda x: (-x[0], x[2]))
+        # Score every key in one expression:
+        #   +10 if the key appears in the entry text
+        #   +0.5 per character (longer keys are more specific)
+        #   -5 for very common words
+        #   +2 if it contains a digit
+        #   +1 for compound words (contain spaces or hyphens)
+        #   +1 for proper nouns (starts with capital letter)
+        # Sorting (-score, position) puts the best keys first and breaks ties by
+        # original order
+        key_scores = sorted(
+            (-((10 if key_lower in keys_in_text else 0)
+               + len(key) * 0.5
+               - (5 if key_lower in _COMMON_WORDS else 0)
+               + (2 if _HAS_DIGIT(key) else 0)
+               + (1 if ' ' in key or '-' in key else 0)
+               + (1 if key[:1].isupper() else 0)),
+             i, key)
+            for i, (key, key_lower) in enumerate(zip(keys, keys_lower))
+        )
         
         # Take the top keys
-        prioritized_keys = [key for _, key, _ in key_scores[:self.max_keys]]
+        prioritized_keys = [key for _, _, key in key_scores[:self.max_keys]]
         
         return prioritized_keys
     
-    def reduce_entry_keys(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+    def reduce_entry_keys(self, entry: Dict[str, Any], timestamp: Optional[int] = None) -> Dict[str, Any]:
         """
         Reduce the number of keys in a single lorebook entry.
         
         Args:
             entry: A single lorebook entry dictionary
+            timestamp: lastUpdatedAt for a reduced entry, in milliseconds (default: now)
             
         Returns:
-            Updated entry with reduced keys
+            The same entry, with its keys reduced in place
         """
         current_keys = entry.get('keys', [])
         entry_text = entry.get('text', '')
@@ -115,24 +143,25 @@ class LorebookKeyReducer:
         # Prioritize and reduce keys
         reduced_keys = self.prioritize_keys(current_keys, entry_text)
         
-        # Create updated entry
-        updated_entry = entry.copy()
-        updated_entry['keys'] = reduced_keys
-        updated_entry['lastUpdatedAt'] = int(datetime.now().timestamp() * 1000)
+        # Update the entry in place
+        entry['keys'] = reduced_keys
+        entry['lastUpdatedAt'] = timestamp if timestamp is not None else int(time.time() * 1000)
         
-        return updated_entry
+        return entry
     
-    def process_lorebook(self, input_file: str, output_file: str) -> None:
+    def process_lorebook(self, input_file: str, output_file: str, quiet: bool = False) -> None:
         """
         Process the entire lorebook and reduce keys in all entries.
         
         Args:
             input_file: Path to input lorebook file
             output_file: Path to output lorebook file
+            quiet: Only print the summary, not a line per entry
         """
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                lorebook = json.load(f)
+            with open(input_file, 'rb') as f:
+                data = f.read()
+            lorebook = orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
             print(f"Error: Input file '{input_file}' not found.")
             sys.exit(1)
@@ -152,12 +181,18 @@ class LorebookKeyReducer:
         total_keys_removed = 0
         entries_modified = 0
         
+        # Every entry reduced in this run gets the same lastUpdatedAt
+        run_timestamp = int(time.time() * 1000)
+        
+        # Per-entry report, written in one go after the loop (left out with --quiet)
+        report = []
+        
         for i, entry in enumerate(entries, 1):
             current_keys = entry.get('keys', [])
             original_count = len(current_keys)
             
             # Process the entry
-            updated_entry = self.reduce_entry_keys(entry)
+            updated_entry = self.reduce_entry_keys(entry, run_timestamp)
             new_keys = updated_entry.get('keys', [])
             new_count = len(new_keys)
             
@@ -166,17 +201,21 @@ class LorebookKeyReducer:
             
             if keys_removed > 0:
                 entries_modified += 1
-                print(f"Entry {i:3d}: '{entry.get('displayName', 'Unknown')}' - "
-                      f"Reduced from {original_count} to {new_count} keys "
-                      f"(removed {keys_removed})")
-                print(f"  Original: {', '.join(current_keys)}")
-                print(f"  Reduced:  {', '.join(new_keys)}")
-            else:
-                print(f"Entry {i:3d}: '{entry.get('displayName', 'Unknown')}' - "
-                      f"No reduction needed ({original_count} keys)")
+                if not quiet:
+                    report.append(f"Entry {i:3d}: '{entry.get('displayName', 'Unknown')}' - "
+                                  f"Reduced from {original_count} to {new_count} keys "
+                                  f"(removed {keys_removed})")
+                    report.append(f"  Original: {', '.join(current_keys)}")
+                    report.append(f"  Reduced:  {', '.join(new_keys)}")
+            elif not quiet:
+                report.append(f"Entry {i:3d}: '{entry.get('displayName', 'Unknown')}' - "
+                              f"No reduction needed ({original_count} keys)")
             
             processed_entries.append(updated_entry)
         
+        if report:
+            sys.stdout.write('\n'.join(report) + '\n')
+        
         # Create the new lorebook
         new_lorebook = {
             "lorebookVersion": lorebook.get("lorebookVersion", 6),
@@ -187,8 +226,12 @@ class LorebookKeyReducer:
         
         # Save the updated lorebook
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(new_lorebook, f, indent=2, ensure_ascii=False)
+            if orjson:
+                data = orjson.dumps(new_lorebook, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(new_lorebook, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(output_file, 'wb') as f:
+                f.write(data)
             
             print(f"\n" + "="*60)
             print("KEY REDUCTION SUMMARY")
@@ -215,6 +258,7 @@ Examples:
   %(prog)s lorebook.lorebook                    # Reduce to 5 keys (default)
   %(prog)s lorebook.lorebook 3                  # Reduce to 3 keys
   %(prog)s lorebook.lorebook 5 reduced.lorebook # Reduce to 5 keys, custom output
+  %(prog)s lorebook.lorebook --quiet            # Print only the summary
         """
     )
     
@@ -223,6 +267,8 @@ Examples:
                        help='Maximum number of keys per entry (default: 5)')
     parser.add_argument('output_file', nargs='?', 
                        help='Output lorebook file (optional, auto-generated if not provided)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only print the summary, not a line per entry')
     
     args = parser.parse_args()
     
@@ -245,7 +291,7 @@ Examples:
     
     # Process the lorebook
     reducer = LorebookKeyReducer(args.max_keys)
-    reducer.process_lorebook(args.input_file, output_file)
+    reducer.process_lorebook(args.input_file, output_file, args.quiet)
 
 
 if __name__ == "__main__":